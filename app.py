@@ -14,6 +14,7 @@ import base64
 import io
 from datetime import datetime
 import os
+import time
 from feature_prioritization_framework import FeaturePrioritizationFramework, FeatureMetrics
 
 # Configure matplotlib for web use
@@ -21,11 +22,34 @@ plt.switch_backend('Agg')
 sns.set_palette("husl")
 
 app = Flask(__name__)
-app.secret_key = 'feature_prioritization_secret_key'
+app.secret_key = os.environ.get('FPF_SECRET_KEY', 'feature_prioritization_secret_key')
 
 # Global framework instance
 framework = FeaturePrioritizationFramework()
 
+# Set once warm_up() has succeeded; reported by the readiness endpoint
+ready = False
+
+def warm_up():
+    """Render a throwaway chart so the font cache and plot style are loaded before serving"""
+    global ready
+    plt.figure(figsize=(2, 2))
+    plt.barh(['warm-up'], [1], color='skyblue')
+    plt.title('Warm-up', fontsize=14, fontweight='bold')
+    plt.xlabel('Priority Score')
+    plt.tight_layout()
+    plt.savefig(io.BytesIO(), format='png', dpi=72)
+    plt.close()
+    ready = True
+
+# Warm up at import so every process that serves requests (gunicorn workers,
+# `flask run`, `python app.py`) is warm. A failure leaves the app serving but
+# not ready.
+try:
+    warm_up()
+except Exception as e:
+    app.logger.warning(f'Warm-up failed, /readyz will report not ready: {e}')
+
 @app.route('/')
 def index():
     """Main page with feature input form"""
@@ -63,8 +87,24 @@ def add_feature():
             risk_score=risk_score
         )
         
+        # Validate dependencies before anything is added
+        depends_on = [name.strip() for name in request.form.get('depends_on', '').split(',') if name.strip()]
+        if feature_name in depends_on:
+            flash(f'Dependency error: feature "{feature_name}" cannot depend on itself.', 'error')
+            return redirect(url_for('index'))
+        if framework.has_feature(feature_name):
+            flash(f'Error: a feature named "{feature_name}" already exists.', 'error')
+            return redirect(url_for('index'))
+        unknown = [name for name in depends_on if not framework.has_feature(name)]
+        if unknown:
+            flash(f'Dependency error: unknown feature(s) {", ".join(unknown)}. '
+                  'Prerequisites must be added first.', 'error')
+            return redirect(url_for('index'))
+        
         # Add to framework
         framework.add_feature(metrics)
+        for prerequisite in depends_on:
+            framework.add_dependency(feature_name, prerequisite)
         
         flash(f'Feature "{feature_name}" added successfully!', 'success')
         return redirect(url_for('index'))
@@ -96,6 +136,70 @@ def results():
                          analytics=analytics,
                          total_features=len(framework.features))
 
+@app.route('/healthz')
+def healthz():
+    """Liveness check: the worker is up and serving requests"""
+    return jsonify({'status': 'ok'})
+
+@app.route('/readyz')
+def readyz():
+    """Readiness check: the worker's warm-up succeeded"""
+    if not ready:
+        return jsonify({'status': 'not ready'}), 503
+    return jsonify({'status': 'ready', 'pid': os.getpid()})
+
+@app.route('/roadmap')
+def roadmap():
+    """Display the dependency-aware roadmap timeline"""
+    if not framework.features:
+        flash('No features added yet. Please add some features first.', 'warning')
+        return redirect(url_for('index'))
+    
+    team_slots = request.args.get('team_slots', 1, type=int)
+    try:
+        df = framework.schedule_roadmap(team_slots)
+    except ValueError as e:
+        flash(f'Roadmap error: {e}', 'error')
+        return redirect(url_for('index'))
+    
+    return render_template('roadmap.html',
+                         roadmap=df.to_dict('records'),
+                         team_slots=team_slots,
+                         dependencies=framework.dependencies,
+                         total_weeks=float(df['end_week'].max()))
+
+@app.route('/api/weights', methods=['GET', 'POST'])
+def weights():
+    """Get or update the viability weights and return the new top-K ranking"""
+    data = request.get_json(silent=True)
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    new_weights = data.get('weights', {})
+    if not isinstance(new_weights, dict):
+        return jsonify({'error': "'weights' must be an object mapping weight names to numbers"}), 400
+    try:
+        k = int(request.args.get('k', data.get('k', 10)))
+    except (TypeError, ValueError):
+        return jsonify({'error': "'k' must be an integer"}), 400
+    
+    try:
+        start = time.perf_counter()
+        if request.method == 'POST':
+            framework.set_weights(new_weights)
+        top_features = framework.top_features(k)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({
+        'weights': framework.weights,
+        'top_features': top_features,
+        'total_features': len(framework.features),
+        'elapsed_ms': round(elapsed_ms, 3)
+    })
+
 @app.route('/api/visualizations')
 def get_visualizations():
     """Generate and return visualization images as base64"""
@@ -199,24 +303,31 @@ def export_results():
 def clear_features():
     """Clear all features"""
     framework.features = []
+    framework.dependencies = {}
     flash('All features cleared', 'success')
     return redirect(url_for('index'))
 
 @app.route('/demo')
 def load_demo():
     """Load demo features"""
-    from feature_prioritization_framework import create_sample_features
+    from feature_prioritization_framework import create_sample_features, create_sample_dependencies
     
     # Clear existing features
     framework.features = []
+    framework.dependencies = {}
     
     # Add demo features
     sample_features = create_sample_features()
     for feature in sample_features:
         framework.add_feature(feature)
+    for feature_name, prerequisites in create_sample_dependencies().items():
+        for prerequisite in prerequisites:
+            framework.add_dependency(feature_name, prerequisite)
     
     flash('Demo features loaded successfully!', 'success')
     return redirect(url_for('results'))
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8080) 
\ No newline at end of file
+    app.run(debug=os.environ.get('FPF_DEBUG', '1') == '1',
+            host=os.environ.get('FPF_HOST', '0.0.0.0'),
+            port=int(os.environ.get('FPF_PORT', 8080))) 
\ No newline at end of file
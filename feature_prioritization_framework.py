@@ -6,6 +6,9 @@ revenue generation, and time savings.
 """
 
 import json
+import heapq
+import math
+import operator
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -14,7 +17,7 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import argparse
 import sys
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 import warnings
 warnings.filterwarnings('ignore')
@@ -23,6 +26,9 @@ warnings.filterwarnings('ignore')
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
+# Largest magnitude accepted by set_weights(); the defaults are all below 1
+MAX_WEIGHT = 100.0
+
 class ImpactLevel(Enum):
     """Impact level enumeration for scoring"""
     LOW = 1
@@ -60,10 +66,65 @@ class FeaturePrioritizationFramework:
             'technical_complexity': -0.05,  # Negative weight
             'risk_score': -0.10  # Negative weight
         }
+        self.dependencies = {}  # feature name -> names of prerequisite features
+        self._names = set()  # names in self._names_source, for fast lookups
+        self._names_source = None
+        
+        # Score cache: one row of normalized component scores per feature,
+        # so a weight change is a single matrix-vector product. Edit features
+        # through update_feature(), or call invalidate_scores() after editing
+        # a FeatureMetrics in place.
+        self._score_keys = list(self.weights)  # column order of the matrix
+        self.invalidate_scores()
+        
+    def _feature_names(self) -> set:
+        """Names of all features, rebuilt if the feature list was changed directly"""
+        if self._names_source is not self.features or len(self._names) != len(self.features):
+            self._names = {feature.feature_name for feature in self.features}
+            self._names_source = self.features
+        return self._names
+        
+    def has_feature(self, feature_name: str) -> bool:
+        """Check whether a feature with this name has been added"""
+        return feature_name in self._feature_names()
         
     def add_feature(self, metrics: FeatureMetrics) -> None:
         """Add a feature to the evaluation framework"""
+        if self.has_feature(metrics.feature_name):
+            raise ValueError(f"Feature '{metrics.feature_name}' already exists")
         self.features.append(metrics)
+        self._names.add(metrics.feature_name)
+        
+    def update_feature(self, feature_name: str, /, **changes) -> None:
+        """Change metrics of an existing feature and rescore it"""
+        index = next((i for i, feature in enumerate(self.features) if feature.feature_name == feature_name), None)
+        if index is None:
+            raise ValueError(f"Unknown feature: '{feature_name}'")
+        editable = {field.name for field in fields(FeatureMetrics)} - {'feature_name'}
+        invalid = set(changes) - editable
+        if invalid:
+            raise ValueError(f"Cannot update: {', '.join(sorted(invalid))}")
+
+        feature = self.features[index]
+        for name, value in changes.items():
+            setattr(feature, name, value)
+        if index < len(self._cached_rows) and self._cached_weights is not None:
+            row = np.array([self._component_scores(feature)[key] for key in self._score_keys])
+            self._component_matrix[index] = row
+            self._priority_base[index] = self._priority_base_score(feature)
+            self._raw_viability[index] = row @ self._cached_weights
+        
+
+    def add_dependency(self, feature_name: str, depends_on: str) -> None:
+        """Declare that a feature cannot start before another feature is finished"""
+        if feature_name == depends_on:
+            raise ValueError(f"Feature '{feature_name}' cannot depend on itself")
+        for name in (feature_name, depends_on):
+            if not self.has_feature(name):
+                raise ValueError(f"Unknown feature: '{name}'")
+        prerequisites = self.dependencies.setdefault(feature_name, [])
+        if depends_on not in prerequisites:
+            prerequisites.append(depends_on)
         
     def calculate_roi_score(self, metrics: FeatureMetrics) -> float:
         """Calculate ROI score based on revenue and cost"""
@@ -77,9 +138,9 @@ class FeaturePrioritizationFramework:
         normalized_time_savings = min(metrics.time_savings_hours / 40, 1.0)
         return normalized_time_savings * 10
         
-    def calculate_viability_score(self, metrics: FeatureMetrics) -> float:
-        """Calculate overall viability score"""
-        scores = {
+    def _component_scores(self, metrics: FeatureMetrics) -> Dict[str, float]:
+        """Normalize a feature's metrics to the 0-10 components weighted by viability"""
+        return {
             'product_impact': metrics.product_impact_score,
             'revenue_potential': min(metrics.revenue_potential / 10000, 10),  # Normalize to 10k max
             'time_savings': self.calculate_time_efficiency_score(metrics),
@@ -90,6 +151,9 @@ class FeaturePrioritizationFramework:
             'risk_score': 11 - metrics.risk_score  # Invert for positive scoring
         }
         
+    def calculate_viability_score(self, metrics: FeatureMetrics) -> float:
+        """Calculate overall viability score"""
+        scores = self._component_scores(metrics)
         weighted_score = sum(scores[key] * self.weights[key] for key in scores.keys())
         return min(max(weighted_score, 0), 10)  # Clamp between 0-10
         
@@ -104,7 +168,93 @@ class FeaturePrioritizationFramework:
         # Combined score
         priority_score = (viability * 0.4 + roi * 0.3 + implementation_efficiency * 0.3)
         return min(max(priority_score, 0), 10)
-        
+
+    def set_weights(self, weights: Dict[str, float]) -> None:
+        """Update some or all viability weights and rescore cached features"""
+        unknown = set(weights) - set(self.weights)
+        if unknown:
+            raise ValueError(f"Unknown weights: {', '.join(sorted(map(str, unknown)))}")
+        new_weights = {key: float(value) for key, value in weights.items()}
+        out_of_range = [key for key, value in new_weights.items()
+                        if not (math.isfinite(value) and abs(value) <= MAX_WEIGHT)]
+        if out_of_range:
+            raise ValueError(f"Weights must be finite numbers between -{MAX_WEIGHT:g} and {MAX_WEIGHT:g}: "
+                             f"{', '.join(sorted(out_of_range))}")
+        self.weights.update(new_weights)
+        self._refresh_score_cache()
+
+    def invalidate_scores(self) -> None:
+        """Drop all cached scores, e.g. after editing a FeatureMetrics in place"""
+        self._cached_rows = []  # features the cache rows were computed from
+        self._component_matrix = np.empty((0, len(self._score_keys)))
+        self._priority_base = np.empty(0)  # weight-independent part of the priority score
+        self._cached_weights = None
+        self._raw_viability = np.empty(0)  # unclamped weighted sums
+
+    def _priority_base_score(self, metrics: FeatureMetrics) -> float:
+        """The part of calculate_priority_score that does not depend on the weights"""
+        return self.calculate_roi_score(metrics) * 0.3 + max(0, 10 - metrics.implementation_time_weeks) * 0.3
+
+    def _refresh_score_cache(self) -> None:
+        """Bring cached component scores and weighted sums up to date"""
+        # Cached rows stay valid only while they are still the leading features,
+        # compared by identity
+        if (len(self._cached_rows) > len(self.features)
+                or any(map(operator.is_not, self.features, self._cached_rows))):
+            self.invalidate_scores()
+
+        weights = np.array([self.weights[key] for key in self._score_keys], dtype=float)
+        cached = len(self._cached_rows)
+        if cached < len(self.features):
+            new_features = self.features[cached:]
+            self._cached_rows.extend(new_features)
+            in_key_order = operator.itemgetter(*self._score_keys)
+            rows = np.array(list(map(in_key_order, map(self._component_scores, new_features))), dtype=float)
+            base = np.fromiter(map(self._priority_base_score, new_features), dtype=float, count=len(new_features))
+            self._component_matrix = np.vstack([self._component_matrix, rows])
+            self._priority_base = np.concatenate([self._priority_base, base])
+            if self._cached_weights is not None:
+                self._raw_viability = np.concatenate([self._raw_viability, rows @ self._cached_weights])
+
+        if self._cached_weights is None:
+            self._raw_viability = self._component_matrix @ weights
+        else:
+            changed = np.flatnonzero(weights != self._cached_weights)
+            if len(changed) == 1 and np.isfinite(self._cached_weights).all() and np.isfinite(weights).all():
+                # A single weight moved: shift every score by that component's delta
+                column = changed[0]
+                self._raw_viability += self._component_matrix[:, column] * (weights[column] - self._cached_weights[column])
+                if not np.isfinite(self._raw_viability).all():
+                    # Overflow (inf - inf = NaN) can't be undone by deltas
+                    self._raw_viability = self._component_matrix @ weights
+            elif len(changed) > 0:
+                self._raw_viability = self._component_matrix @ weights
+        self._cached_weights = weights
+
+    def viability_scores(self) -> np.ndarray:
+        """Viability scores of all features, in feature order, from the score cache"""
+        self._refresh_score_cache()
+        return np.clip(self._raw_viability, 0, 10)
+
+    def priority_scores(self) -> np.ndarray:
+        """Priority scores of all features, in feature order, from the score cache"""
+        return np.clip(self.viability_scores() * 0.4 + self._priority_base, 0, 10)
+
+    def top_features(self, k: int = 10) -> List[Dict]:
+        """Get the k features with the highest priority scores, best first"""
+        priorities = self.priority_scores()
+        viabilities = np.clip(self._raw_viability, 0, 10)
+        k = min(max(k, 0), len(priorities))
+        if k == 0:
+            return []
+        top = np.argpartition(-priorities, k - 1)[:k]
+        top = top[np.argsort(-priorities[top], kind='stable')]
+        return [{
+            'feature_name': self.features[i].feature_name,
+            'priority_score': round(float(priorities[i]), 2),
+            'viability_score': round(float(viabilities[i]), 2)
+        } for i in top]
+
     def get_feature_analytics(self, metrics: FeatureMetrics) -> Dict:
         """Get comprehensive analytics for a feature"""
         return {
@@ -172,7 +322,143 @@ class FeaturePrioritizationFramework:
         df = pd.DataFrame(comparison_data)
         df = df.sort_values('priority_score', ascending=False)
         return df
-        
+
+    def _build_dependency_graph(self) -> Tuple[List[List[int]], List[int]]:
+        """Build successor lists and in-degrees indexed by feature position"""
+        index = {feature.feature_name: i for i, feature in enumerate(self.features)}
+        if len(index) != len(self.features):
+            raise ValueError("Feature names must be unique to build a roadmap")
+
+        successors = [[] for _ in self.features]
+        in_degree = [0] * len(self.features)
+        for feature_name, prerequisites in self.dependencies.items():
+            if feature_name not in index:
+                raise ValueError(f"Unknown feature in dependencies: '{feature_name}'")
+            node = index[feature_name]
+            try:
+                for prerequisite in map(index.__getitem__, prerequisites):
+                    successors[prerequisite].append(node)
+            except KeyError as e:
+                raise ValueError(f"Unknown prerequisite '{e.args[0]}' for feature '{feature_name}'") from None
+            in_degree[node] = len(prerequisites)
+        return successors, in_degree
+
+    def _topological_order(self, successors: List[List[int]], in_degree: List[int]) -> List[int]:
+        """Order features so every prerequisite comes first (Kahn's algorithm)"""
+        remaining = list(in_degree)
+        order = [node for node, degree in enumerate(remaining) if degree == 0]
+        for node in order:  # order grows while we iterate over it
+            for successor in successors[node]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    order.append(successor)
+
+        if len(order) < len(successors):
+            raise ValueError(f"Dependency cycle detected: {' -> '.join(self._find_cycle(remaining))}")
+        return order
+
+    def _find_cycle(self, remaining: List[int]) -> List[str]:
+        """Find one dependency cycle among features left unordered by a topological sort"""
+        # Every unordered feature still waits on an unordered prerequisite,
+        # so following prerequisites from any of them must revisit a feature.
+        blocked = {self.features[node].feature_name for node, degree in enumerate(remaining) if degree > 0}
+        path = [next(iter(blocked))]
+        seen = {path[0]: 0}
+        while True:
+            prerequisite = next(name for name in self.dependencies[path[-1]] if name in blocked)
+            if prerequisite in seen:
+                cycle = path[seen[prerequisite]:] + [prerequisite]
+                return cycle[::-1]
+            seen[prerequisite] = len(path)
+            path.append(prerequisite)
+
+    def schedule_roadmap(self, team_slots: int = 1) -> pd.DataFrame:
+        """Schedule features onto parallel team slots, respecting dependencies"""
+        if team_slots < 1:
+            raise ValueError("At least one team slot is required")
+        if not self.features:
+            return pd.DataFrame()
+
+        successors, in_degree = self._build_dependency_graph()
+        order = self._topological_order(successors, in_degree)
+
+        durations = [max(feature.implementation_time_weeks, 0) for feature in self.features]
+        priorities = self.priority_scores().tolist()
+
+        # Critical path: longest chain of implementation weeks from a feature to the end
+        critical_path = [0.0] * len(self.features)
+        tail_weeks = critical_path.__getitem__
+        for node in reversed(order):
+            tail = successors[node]
+            critical_path[node] = durations[node] + (max(map(tail_weeks, tail)) if tail else 0)
+
+        # List scheduling: whenever a slot is free, start the highest-priority
+        # ready feature, breaking ties by the longest critical path. Ranking
+        # every feature up front lets the ready heap compare plain ints.
+        by_rank = np.lexsort((np.arange(len(self.features)), -np.array(critical_path),
+                              -np.array(priorities))).tolist()
+        rank = [0] * len(self.features)
+        for position, node in enumerate(by_rank):
+            rank[node] = position
+        ready = [rank[node] for node, degree in enumerate(in_degree) if degree == 0]
+        heapq.heapify(ready)
+        # More slots than features can never be used
+        free_slots = list(range(min(team_slots, len(self.features))))
+        running = []  # (end week, slot, feature index)
+        waiting = list(in_degree)
+        now = 0.0
+        scheduled, slots, starts = [], [], []
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        while ready or running:
+            while ready and free_slots:
+                node = by_rank[heappop(ready)]
+                slot = heappop(free_slots)
+                heappush(running, (now + durations[node], slot, node))
+                scheduled.append(node)
+                slots.append(slot)
+                starts.append(now)
+
+            now = running[0][0]
+            while running and running[0][0] == now:
+                _, slot, node = heappop(running)
+                heappush(free_slots, slot)
+                for successor in successors[node]:
+                    waiting[successor] -= 1
+                    if not waiting[successor]:
+                        heappush(ready, rank[successor])
+
+        # Dependencies are left out here; look them up in self.dependencies for display
+        starts = np.array(starts)
+        return pd.DataFrame({
+            'feature_name': [self.features[node].feature_name for node in scheduled],
+            'team_slot': np.array(slots) + 1,
+            'start_week': np.round(starts, 2),
+            'end_week': np.round(starts + np.array(durations)[scheduled], 2),
+            'priority_score': np.round(np.array(priorities)[scheduled], 2),
+            'critical_path_weeks': np.round(np.array(critical_path)[scheduled], 2)
+        })
+
+    def print_roadmap(self, team_slots: int = 1, width: int = 40) -> None:
+        """Print the roadmap as a text timeline"""
+        roadmap = self.schedule_roadmap(team_slots)
+        if roadmap.empty:
+            print("No features to schedule")
+            return
+
+        total_weeks = roadmap['end_week'].max()
+        scale = width / total_weeks if total_weeks > 0 else 0
+        name_width = min(roadmap['feature_name'].str.len().max(), 30)
+
+        print(f"Roadmap: {len(roadmap)} features on {team_slots} team slot(s), {total_weeks} weeks total")
+        print("=" * 80)
+        for row in roadmap.itertuples(index=False):
+            offset = int(round(row.start_week * scale))
+            length = max(int(round(row.end_week * scale)) - offset, 1)
+            bar = " " * offset + "█" * length
+            print(f"{row.feature_name[:name_width]:<{name_width}}  slot {row.team_slot}  "
+                  f"|{bar:<{width}}| wk {row.start_week:g}-{row.end_week:g}")
+
     def generate_visualizations(self, save_path: str = None) -> None:
         """Generate comprehensive visualizations"""
         if not self.features:
@@ -247,6 +533,7 @@ class FeaturePrioritizationFramework:
             'timestamp': datetime.now().isoformat(),
             'total_features': len(self.features),
             'framework_weights': self.weights,
+            'dependencies': self.dependencies,
             'feature_analytics': [self.get_feature_analytics(feature) for feature in self.features],
             'comparison_data': self.compare_features().to_dict('records')
         }
@@ -316,12 +603,31 @@ def create_sample_features() -> List[FeatureMetrics]:
         )
     ]
 
+def create_sample_dependencies() -> Dict[str, List[str]]:
+    """Create sample dependencies between the sample features"""
+    return {
+        "AI-Powered Chatbot": ["Advanced Analytics Dashboard"],
+        "Mobile App Integration": ["Automated Reporting System"]
+    }
+
+def positive_int(value: str) -> int:
+    """argparse type for integers of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     """Main function to run the framework"""
     parser = argparse.ArgumentParser(description='Feature Prioritization Framework')
     parser.add_argument('--demo', action='store_true', help='Run with demo data')
     parser.add_argument('--export', type=str, help='Export results to file')
     parser.add_argument('--visualize', type=str, help='Save visualization to file')
+    parser.add_argument('--team-slots', type=positive_int, default=1,
+                        help='Number of features the team can build in parallel on the roadmap')
     
     args = parser.parse_args()
     
@@ -333,6 +639,9 @@ def main():
         sample_features = create_sample_features()
         for feature in sample_features:
             framework.add_feature(feature)
+        for feature_name, prerequisites in create_sample_dependencies().items():
+            for prerequisite in prerequisites:
+                framework.add_dependency(feature_name, prerequisite)
             
         print("=== Feature Prioritization Framework Demo ===\n")
         
@@ -343,6 +652,11 @@ def main():
         print(df.to_string(index=False))
         print("\n" + "=" * 80)
         
+        # Display dependency-aware roadmap
+        print()
+        framework.print_roadmap(args.team_slots)
+        print("=" * 80)
+        
         # Generate visualizations
         if args.visualize:
             framework.generate_visualizations(args.visualize)
@@ -382,8 +696,22 @@ def main():
                     strategic_alignment=float(input("Strategic alignment (1-10): ")),
                     risk_score=float(input("Risk score (1-10, lower is better): "))
                 )
+                depends_on = input("Depends on (comma-separated feature names, optional): ")
+                prerequisites = [name.strip() for name in depends_on.split(',') if name.strip()]
+                
+                # Validate before adding so a bad entry leaves nothing behind
+                if framework.has_feature(feature_name):
+                    print(f"Error: feature '{feature_name}' already exists.")
+                    continue
+                unknown = [name for name in prerequisites if not framework.has_feature(name)]
+                if unknown:
+                    print(f"Error: unknown prerequisites: {', '.join(unknown)}. "
+                          "Dependencies must name features that were already added.")
+                    continue
                 
                 framework.add_feature(metrics)
+                for prerequisite in prerequisites:
+                    framework.add_dependency(feature_name, prerequisite)
                 print(f"\n✓ Feature '{feature_name}' added successfully!")
                 
             except ValueError as e:
@@ -414,6 +742,15 @@ def main():
                 print(f"   Recommendation: {analytics['recommendation']}")
                 print(f"   Risk Level: {analytics['risk_level']}")
                 
+            # Show dependency-aware roadmap
+            print("\n" + "=" * 50)
+            print("ROADMAP")
+            print("=" * 50)
+            try:
+                framework.print_roadmap(args.team_slots)
+            except ValueError as e:
+                print(f"Could not build roadmap: {e}")
+                
             # Generate visualizations
             framework.generate_visualizations()
             
@@ -1,60 +1,174 @@
 #!/usr/bin/env python3
 """
 Startup script for the Feature Prioritization Framework Web Interface
+
+By default the Flask development server is started. With --production the app
+is served by gunicorn: the framework is imported and the matplotlib font cache
+and style are warmed up once in the master process, then workers are forked so
+they share those pages copy-on-write. Feature data lives in each worker's
+memory, so only a single worker (the default) gives consistent results, and
+it is lost whenever a worker is restarted.
+
+Every option can also be set through an FPF_* environment variable.
 """
 
+import argparse
+import gc
 import os
 import sys
 import subprocess
-import webbrowser
-import time
+
+VENV_PATH = os.environ.get('FPF_VENV', 'feature_prioritization_env')
+
+REQUIRED_FILES = [
+    "app.py",
+    "feature_prioritization_framework.py",
+    "templates/base.html",
+    "templates/index.html",
+    "templates/results.html",
+    "templates/roadmap.html"
+]
+
+def parse_args():
+    """Parse CLI flags, falling back to FPF_* environment variables"""
+    env = os.environ.get
+    parser = argparse.ArgumentParser(description='Feature Prioritization Framework - Web Interface')
+    parser.add_argument('--production', action='store_true', default=env('FPF_PRODUCTION') == '1',
+                        help='Run a gunicorn WSGI server instead of the debug server (FPF_PRODUCTION=1)')
+    parser.add_argument('--host', default=env('FPF_HOST', '0.0.0.0'),
+                        help='Interface to bind (FPF_HOST)')
+    parser.add_argument('--port', type=int, default=int(env('FPF_PORT', 8080)),
+                        help='Port to bind (FPF_PORT)')
+    parser.add_argument('--workers', type=int, default=int(env('FPF_WORKERS', 1)),
+                        help='Number of worker processes in production mode; features are kept '
+                             'in memory per worker, so only 1 is consistent (FPF_WORKERS)')
+    parser.add_argument('--timeout', type=int, default=int(env('FPF_TIMEOUT', 60)),
+                        help='Seconds before a silent worker is killed and restarted, losing its '
+                             'in-memory data (FPF_TIMEOUT)')
+    parser.add_argument('--graceful-timeout', type=int, default=int(env('FPF_GRACEFUL_TIMEOUT', 30)),
+                        help='Seconds workers get to finish requests on reload/shutdown (FPF_GRACEFUL_TIMEOUT)')
+    parser.add_argument('--max-requests', type=int, default=int(env('FPF_MAX_REQUESTS', 0)),
+                        help='Restart a worker after this many requests, 0 to disable; a restarted '
+                             'worker loses its in-memory data (FPF_MAX_REQUESTS)')
+    parser.add_argument('--pidfile', default=env('FPF_PIDFILE'),
+                        help='Write the server PID here, e.g. for "kill -USR2" upgrades (FPF_PIDFILE)')
+    parser.add_argument('--log-level', default=env('FPF_LOG_LEVEL', 'info'),
+                        help='Server log level (FPF_LOG_LEVEL)')
+    return parser.parse_args()
+
+def venv_python():
+    """Path of the virtual environment's Python interpreter"""
+    if sys.platform == "win32":
+        return os.path.join(VENV_PATH, "Scripts", "python.exe")
+    return os.path.join(VENV_PATH, "bin", "python")
+
+def run_development(args):
+    """Run Flask's debug server from app.py"""
+    env = dict(os.environ, FPF_HOST=args.host, FPF_PORT=str(args.port))
+    return subprocess.run([sys.executable, "app.py"], env=env).returncode
+
+def run_production(args):
+    """Run app.py under a preforked, pre-warmed gunicorn server"""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("❌ Production mode requires gunicorn (Linux/macOS).")
+        print("   Run: pip install -r requirements.txt")
+        return 1
+
+    class ProductionServer(BaseApplication):
+        """gunicorn application that preloads and warms up app.py before forking"""
+
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            import app  # warms up at import, before workers are forked
+            # Move everything loaded so far out of the collector's reach so
+            # workers don't write to (and copy) the shared pages during GC.
+            gc.freeze()
+            return app.app
+
+    if args.workers > 1:
+        print("!" * 50)
+        print(f"⚠️  WARNING: running {args.workers} workers, but each worker keeps its")
+        print("   own in-memory features, dependencies and weights. Requests")
+        print("   will see different data depending on which worker serves")
+        print("   them. Use --workers 1 unless every worker is read-only.")
+        print("!" * 50)
+
+    if args.max_requests > 0:
+        print("!" * 50)
+        print(f"⚠️  WARNING: workers restart every ~{args.max_requests} requests, and a")
+        print("   restarted worker starts with no features, dependencies or")
+        print("   custom weights. Use --max-requests 0 to keep them.")
+        print("!" * 50)
+
+    options = {
+        'bind': f"{args.host}:{args.port}",
+        'workers': args.workers,
+        'worker_class': 'sync',
+        'preload_app': True,
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests // 10,
+        'pidfile': args.pidfile,
+        'loglevel': args.log_level,
+        'accesslog': '-'
+    }
+    print(f"   Workers: {args.workers} (master PID {os.getpid()})")
+    print("   Note: restarting workers (kill -HUP, --max-requests, --timeout) clears in-memory data")
+    print("   To load new code: kill -USR2 <master PID>, then kill -QUIT the old master")
+    print("   Health: /healthz   Readiness: /readyz")
+    ProductionServer(options).run()
+    return 0
 
 def main():
+    args = parse_args()
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
     print("🚀 Feature Prioritization Framework - Web Interface")
     print("=" * 50)
-    
-    # Check if virtual environment exists
-    venv_path = "feature_prioritization_env"
-    if not os.path.exists(venv_path):
-        print("❌ Virtual environment not found. Please run the setup first.")
-        print("   Run: python3 -m venv feature_prioritization_env")
-        print("   Then: source feature_prioritization_env/bin/activate")
-        print("   And: pip install -r requirements.txt")
-        return
-    
-    # Check if required files exist
-    required_files = [
-        "app.py",
-        "feature_prioritization_framework.py",
-        "templates/base.html",
-        "templates/index.html",
-        "templates/results.html"
-    ]
-    
-    missing_files = [f for f in required_files if not os.path.exists(f)]
+
+    # Re-run this script inside the virtual environment if it isn't active
+    if os.path.exists(venv_python()):
+        if os.path.realpath(sys.prefix) != os.path.realpath(VENV_PATH):
+            try:
+                sys.exit(subprocess.run([venv_python(), os.path.abspath(__file__)] + sys.argv[1:]).returncode)
+            except KeyboardInterrupt:
+                print("\n\n👋 Server stopped. Goodbye!")
+                return
+    else:
+        print(f"⚠️  Virtual environment '{VENV_PATH}' not found, using {sys.executable}")
+        print("   To create it: python3 -m venv feature_prioritization_env")
+        print("   Then: pip install -r requirements.txt")
+
+    missing_files = [f for f in REQUIRED_FILES if not os.path.exists(f)]
     if missing_files:
         print("❌ Missing required files:")
         for file in missing_files:
             print(f"   - {file}")
         return
-    
+
     print("✅ All required files found")
-    
-    # Activate virtual environment and run Flask app
+
     try:
-        print("\n🌐 Starting web interface...")
-        print("   The application will be available at: http://localhost:5000")
+        mode = "production" if args.production else "development"
+        print(f"\n🌐 Starting web interface ({mode} mode)...")
+        print(f"   The application will be available at: http://localhost:{args.port}")
         print("   Press Ctrl+C to stop the server")
         print("\n" + "=" * 50)
-        
-        # Run Flask app
-        if sys.platform == "win32":
-            activate_cmd = f"{venv_path}\\Scripts\\activate && python app.py"
-        else:
-            activate_cmd = f"source {venv_path}/bin/activate && python app.py"
-        
-        subprocess.run(activate_cmd, shell=True)
-        
+
+        if args.production:
+            sys.exit(run_production(args))
+        sys.exit(run_development(args))
+
     except KeyboardInterrupt:
         print("\n\n👋 Server stopped. Goodbye!")
     except Exception as e:
@@ -63,8 +177,8 @@ def main():
         print("1. Make sure all dependencies are installed:")
         print("   source feature_prioritization_env/bin/activate")
         print("   pip install -r requirements.txt")
-        print("2. Check if port 5000 is available")
+        print(f"2. Check if port {args.port} is available")
         print("3. Try running manually: python app.py")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
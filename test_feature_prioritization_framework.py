@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached scoring used by top_features() and schedule_roadmap()
+"""
+
+import numpy as np
+import pytest
+
+from feature_prioritization_framework import (
+    FeaturePrioritizationFramework, FeatureMetrics, create_sample_features
+)
+
+def make_framework():
+    framework = FeaturePrioritizationFramework()
+    for feature in create_sample_features():
+        framework.add_feature(feature)
+    return framework
+
+def cached_priorities(framework):
+    return {item['feature_name']: item['priority_score']
+            for item in framework.top_features(len(framework.features))}
+
+def expected_priorities(framework):
+    return {feature.feature_name: round(framework.calculate_priority_score(feature), 2)
+            for feature in framework.features}
+
+def test_cache_rebuilds_after_remove_then_add():
+    framework = make_framework()
+    framework.top_features()
+
+    framework.features.pop(0)
+    framework.add_feature(FeatureMetrics("Tiny", 1, 0, 0, 1e6, 30, 1, 1, 10, 1, 10))
+
+    assert cached_priorities(framework) == expected_priorities(framework)
+    roadmap = framework.schedule_roadmap()
+    assert roadmap['feature_name'].iloc[-1] == "Tiny"
+
+def test_update_feature_rescores_cached_row():
+    framework = make_framework()
+    framework.top_features()
+
+    framework.update_feature("Mobile App Integration", development_cost=1e9)
+
+    assert framework.features[1].development_cost == 1e9
+    assert cached_priorities(framework) == expected_priorities(framework)
+
+def test_update_feature_rejects_unknown_feature_and_fields():
+    framework = make_framework()
+    with pytest.raises(ValueError, match="Unknown feature"):
+        framework.update_feature("Nonexistent", risk_score=1)
+    with pytest.raises(ValueError, match="Cannot update"):
+        framework.update_feature("Mobile App Integration", feature_name="Renamed")
+
+def test_invalidate_scores_after_in_place_edit():
+    framework = make_framework()
+    framework.top_features()
+
+    framework.features[1].development_cost = 1e9
+    framework.invalidate_scores()
+
+    assert cached_priorities(framework) == expected_priorities(framework)
+
+def test_set_weights_matches_direct_calculation():
+    framework = make_framework()
+    framework.top_features()
+
+    framework.set_weights({'revenue_potential': 0.05})
+    assert cached_priorities(framework) == expected_priorities(framework)
+    framework.set_weights({'product_impact': 0.5, 'risk_score': -0.3})
+    assert cached_priorities(framework) == expected_priorities(framework)
+
+@pytest.mark.parametrize('value', [float('nan'), float('inf')])
+def test_set_weights_rejects_non_finite_values(value):
+    framework = make_framework()
+    with pytest.raises(ValueError):
+        framework.set_weights({'risk_score': value})
+    assert framework.weights['risk_score'] == -0.10
+
+def test_add_dependency_rejects_unknown_features():
+    framework = make_framework()
+    with pytest.raises(ValueError, match="Unknown feature: 'Nonexistent'"):
+        framework.add_dependency("AI-Powered Chatbot", "Nonexistent")
+    with pytest.raises(ValueError, match="Unknown feature: 'Nonexistent'"):
+        framework.add_dependency("Nonexistent", "AI-Powered Chatbot")
+    assert framework.dependencies == {}
+
+def test_add_feature_rejects_duplicate_names():
+    framework = make_framework()
+    with pytest.raises(ValueError, match="already exists"):
+        framework.add_feature(create_sample_features()[0])
+    assert len(framework.features) == 4
+
+def test_set_weights_rejects_out_of_range_values():
+    framework = make_framework()
+    with pytest.raises(ValueError):
+        framework.set_weights({'risk_score': 1e308})
+    assert framework.weights['risk_score'] == -0.10
+
+def test_delta_update_recovers_from_overflow():
+    framework = make_framework()
+    framework.weights['risk_score'] = 1e308  # bypasses set_weights' range check
+    framework.top_features()
+
+    framework.set_weights({'risk_score': -0.1})
+
+    assert np.isfinite(framework.priority_scores()).all()
+    assert cached_priorities(framework) == expected_priorities(framework)
+
+def make_feature(name, weeks, impact=5):
+    return FeatureMetrics(name, impact, 1e4, 1, 1e5, weeks, 20, 5, 5, 5, 5)
+
+def make_dag_framework():
+    # A -> B -> D, A -> C -> D, E independent
+    framework = FeaturePrioritizationFramework()
+    for name, weeks in [("A", 2), ("B", 3), ("C", 1), ("D", 2), ("E", 4)]:
+        framework.add_feature(make_feature(name, weeks))
+    for feature, prerequisite in [("B", "A"), ("C", "A"), ("D", "B"), ("D", "C")]:
+        framework.add_dependency(feature, prerequisite)
+    return framework
+
+def assert_valid_schedule(framework, roadmap, team_slots):
+    rows = roadmap.set_index('feature_name')
+    assert sorted(rows.index) == sorted(f.feature_name for f in framework.features)
+    for feature, prerequisites in framework.dependencies.items():
+        for prerequisite in prerequisites:
+            assert rows.loc[feature, 'start_week'] >= rows.loc[prerequisite, 'end_week']
+    assert roadmap['team_slot'].between(1, team_slots).all()
+    for _, slot_rows in roadmap.groupby('team_slot'):
+        slot_rows = slot_rows.sort_values('start_week')
+        assert (slot_rows['start_week'].values[1:] >= slot_rows['end_week'].values[:-1]).all()
+
+def test_topological_order_puts_prerequisites_first():
+    framework = make_dag_framework()
+    order = framework._topological_order(*framework._build_dependency_graph())
+    position = {framework.features[node].feature_name: i for i, node in enumerate(order)}
+    for feature, prerequisites in framework.dependencies.items():
+        for prerequisite in prerequisites:
+            assert position[prerequisite] < position[feature]
+
+def test_cycle_raises_with_path():
+    framework = make_dag_framework()
+    framework.add_dependency("A", "D")
+    with pytest.raises(ValueError, match="Dependency cycle detected") as excinfo:
+        framework.schedule_roadmap()
+
+    cycle = str(excinfo.value).split(": ", 1)[1].split(" -> ")
+    assert cycle[0] == cycle[-1] and "E" not in cycle
+    for prerequisite, feature in zip(cycle, cycle[1:]):
+        assert prerequisite in framework.dependencies[feature]
+
+def test_unknown_prerequisite_raises():
+    framework = make_dag_framework()
+    framework.dependencies["B"].append("Ghost")  # bypasses add_dependency's check
+    with pytest.raises(ValueError, match="Unknown prerequisite 'Ghost' for feature 'B'"):
+        framework.schedule_roadmap()
+
+def test_single_slot_runs_features_back_to_back():
+    framework = make_dag_framework()
+    roadmap = framework.schedule_roadmap(team_slots=1)
+
+    assert_valid_schedule(framework, roadmap, 1)
+    assert roadmap['end_week'].max() == 12
+    assert (roadmap['start_week'].values[1:] == roadmap['end_week'].values[:-1]).all()
+
+def test_parallel_slots_finish_on_critical_path():
+    framework = make_dag_framework()
+    roadmap = framework.schedule_roadmap(team_slots=3)
+
+    assert_valid_schedule(framework, roadmap, 3)
+    assert roadmap['end_week'].max() == roadmap['critical_path_weeks'].max() == 7
+    assert roadmap.set_index('feature_name').loc["A", 'critical_path_weeks'] == 7
+    with pytest.raises(ValueError):
+        framework.schedule_roadmap(team_slots=0)
+
+def test_ready_features_start_by_priority_then_critical_path():
+    framework = FeaturePrioritizationFramework()
+    framework.add_feature(make_feature("Short Tail", 2))
+    framework.add_feature(make_feature("Long Tail", 2))
+    framework.add_feature(make_feature("Follow-up", 6))
+    framework.add_feature(make_feature("Top Priority", 2, impact=10))
+    framework.add_dependency("Follow-up", "Long Tail")
+
+    roadmap = framework.schedule_roadmap(team_slots=1)
+    assert list(roadmap['feature_name'][:3]) == ["Top Priority", "Long Tail", "Short Tail"]